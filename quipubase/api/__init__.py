@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from ..lib import setup
 from .audio import route as audio_routes
@@ -37,13 +38,13 @@ def create_app():
         Quipubase empowers developers to build responsive, intelligent, and scalable AI-driven solutions with ease.
         """,
         version="0.0.1",
+        default_response_class=ORJSONResponse,
     )
     for r in (
         audio_routes,
         collections_routes,
         chat_routes,
         objects_routes,
-        audio_routes,
         images_routes,
         files_routes,
         models_routes,
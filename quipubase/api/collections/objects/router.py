@@ -1,20 +1,116 @@
 from __future__ import annotations
 
 import asyncio
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Optional, cast
 
+import orjson
 from fastapi import APIRouter, Request
+from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
 
 from ....lib.exceptions import QuipubaseException
 from ....lib.utils import get_logger, handle
 from ..service import CollectionManager
-from ..typedefs import PubResponse, QuipubaseRequest, SubResponse
+from ..typedefs import Collection, PubResponse, QuipubaseRequest, SubResponse
 from .service import PubSub
 
 logger = get_logger("[ObjectsRouter]")
 
 
+def _apply(klass: type[Collection], req: QuipubaseRequest):
+    """Run a single `QuipubaseRequest` against a collection class"""
+    item = None
+
+    # Verificar si la solicitud tiene un ID
+    if req.id is not None and req.event in ("update", "delete"):
+        item = klass.retrieve(id=req.id)
+        assert item.id is not None, "Item retrieved didn't have an id"
+        if req.data is not None:
+            # Si hay datos, actualizamos el ítem existente
+            item.update(id=item.id, **req.data)
+        else:
+            # Si no hay datos, eliminamos el ítem
+            item.delete(id=req.id)
+    elif req.data is not None and req.event in ("create", "update"):
+        # Si no hay ID, creamos un nuevo ítem si los datos están presentes
+        item = klass.model_validate(req.data)
+        if item.id is not None and req.event == "update":
+            # Si el ítem tiene un ID, actualizamos
+            klass.update(id=item.id, **req.data)
+        else:
+            # Si no tiene ID, lo creamos
+            item.create()
+    elif req.event == "query":
+        item = list(klass.find(**req.data if req.data else {}))
+    elif req.event == "read":
+        assert req.id is not None, "Not id provided for `read` request"
+        item = klass.retrieve(id=req.id)
+    else:
+        assert req.event == "stop"
+    if item is None:
+        raise QuipubaseException(detail="No data available", status_code=-12500)
+    return item
+
+
+def _check(klass: type[Collection], reqs: list[QuipubaseRequest]) -> None:
+    """Reject a batch before any write if one of its actions cannot run"""
+    # Each record as it will stand when the action runs, None if missing or deleted
+    records: dict[str, Optional[dict[str, Any]]] = {}
+
+    def record(id: str) -> Optional[dict[str, Any]]:
+        if id not in records:
+            raw = klass.db().get(id)
+            records[id] = None
+            if raw is not None:
+                records[id] = klass.model_validate(orjson.loads(raw)).model_dump()
+        return records[id]
+
+    def validate(prefix: str, data: dict[str, Any]) -> Collection:
+        try:
+            return klass.model_validate(data)
+        except ValidationError as e:
+            raise QuipubaseException(status_code=422, detail=f"{prefix}: {e}")
+
+    def merge(prefix: str, id: str, data: dict[str, Any]) -> dict[str, Any]:
+        current = record(id)
+        if current is None:
+            raise QuipubaseException(
+                status_code=404, detail=f"{prefix}: record '{id}' not found"
+            )
+        # Same merge as `Collection.update`, which only overwrites known fields
+        changes = {k: v for k, v in data.items() if k in current and k != "id"}
+        return validate(prefix, {**current, **changes}).model_dump()
+
+    for index, req in enumerate(reqs):
+        prefix = f"Action {index} ({req.event})"
+        if req.id is not None and req.event in ("update", "delete"):
+            if req.data is not None:
+                records[req.id] = merge(prefix, req.id, req.data)
+            elif record(req.id) is None:
+                raise QuipubaseException(
+                    status_code=404, detail=f"{prefix}: record '{req.id}' not found"
+                )
+            else:
+                records[req.id] = None
+        elif req.data is not None and req.event in ("create", "update"):
+            item = validate(prefix, req.data)
+            id = cast(str, item.id)
+            records[id] = (
+                merge(prefix, id, req.data)
+                if req.event == "update"
+                else item.model_dump()
+            )
+        elif req.event == "read":
+            if req.id is None or record(req.id) is None:
+                raise QuipubaseException(
+                    status_code=404, detail=f"{prefix}: record '{req.id}' not found"
+                )
+        elif req.event != "query":
+            raise QuipubaseException(
+                status_code=400, detail=f"{prefix}: nothing to apply"
+            )
+
+
 def route() -> APIRouter:
     router = APIRouter(tags=["collections"], prefix="/collections")
     col_manager = CollectionManager()
@@ -25,41 +121,40 @@ def route() -> APIRouter:
         klass = await col_manager.retrieve_collection(collection_id)
 
         pubsub = PubSub[klass]()
-        item = None
-
-        # Verificar si la solicitud tiene un ID
-        if req.id is not None and req.event in ("update", "delete"):
-            item = klass.retrieve(id=req.id)
-            assert item.id is not None, "Item retrieved didn't have an id"
-            if req.data is not None:
-                # Si hay datos, actualizamos el ítem existente
-                item.update(id=item.id, **req.data)
-            else:
-                # Si no hay datos, eliminamos el ítem
-                item.delete(id=req.id)
-        elif req.data is not None and req.event in ("create", "update"):
-            # Si no hay ID, creamos un nuevo ítem si los datos están presentes
-            item = klass.model_validate(req.data)
-            if item.id is not None and req.event == "update":
-                # Si el ítem tiene un ID, actualizamos
-                klass.update(id=item.id, **req.data)
-            else:
-                # Si no tiene ID, lo creamos
-                item.create()
-        elif req.event == "query":
-            item = list(klass.find(**req.data if req.data else {}))
-        elif req.event == "read":
-            assert req.id is not None, "Not id provided for `read` request"
-            item = klass.retrieve(id=req.id)
-        else:
-            assert req.event == "stop"
-        if item is None:
-            raise QuipubaseException(detail="No data available", status_code=-12500)
+        item = _apply(klass, req)
         event = SubResponse[klass](event=req.event, data=item)
         await pubsub.pub(collection_id, event)  # type: ignore
-        assert item is not None
         return PubResponse[klass](collection=collection_id, data=item, event=req.event)
 
+    @router.post("/objects/{collection_id}/batch", response_model=list[PubResponse])
+    async def _(collection_id: str, reqs: list[QuipubaseRequest]):
+        """Run several requests against a collection in a single round trip"""
+        klass = await col_manager.retrieve_collection(collection_id)
+        _check(klass, reqs)
+
+        pubsub = PubSub[klass]()
+        events: list[SubResponse[klass]] = []
+        responses: list[PubResponse[klass]] = []
+        try:
+            for index, req in enumerate(reqs):
+                try:
+                    item = _apply(klass, req)
+                except Exception as e:
+                    raise QuipubaseException(
+                        status_code=500,
+                        detail=f"Action {index} ({req.event}) failed: {getattr(e, 'detail', e)}",
+                    ) from e
+                events.append(SubResponse[klass](event=req.event, data=item))
+                responses.append(
+                    PubResponse[klass](
+                        collection=collection_id, data=item, event=req.event
+                    )
+                )
+        finally:
+            # Actions that ran are committed, so subscribers must hear about them
+            await pubsub.pub_many(collection_id, events)  # type: ignore
+        return responses
+
     @router.get("/objects/{collection_id}", response_class=EventSourceResponse)
     async def _(request: Request, collection_id: str):
         """Subscribe to events for a specific collection"""
@@ -1,4 +1,3 @@
-import asyncio
 import typing as tp
 
 from quipubase.lib import cache_store
@@ -22,21 +21,25 @@ class PubSub(tp.Generic[T]):
     async def pub(self, channel: str, event: SubResponse[T]) -> None:
         await cache_store.publish(channel, event.model_dump_json())  # type: ignore
 
+    async def pub_many(self, channel: str, events: list[SubResponse[T]]) -> None:
+        if not events:
+            return
+        async with cache_store.pipeline(transaction=False) as pipe:  # type: ignore
+            for event in events:
+                pipe.publish(channel, event.model_dump_json())  # type: ignore
+            await pipe.execute()  # type: ignore
+
     async def sub(self, channel: str) -> tp.AsyncGenerator[SubResponse[T], None]:
         await self._pubsub.subscribe(channel)  # type: ignore
+        model = SubResponse[self._model]  # type: ignore
         try:
-            while True:
-                msg = await self._pubsub.get_message(  # type: ignore
-                    ignore_subscribe_messages=True, timeout=1.0
-                )
-                if msg and msg["type"] == "message":
-                    try:
-                        raw = msg["data"]  # type: ignore
-                        event = SubResponse[self._model].model_validate_json(raw)  # type: ignore
-                        yield event
-                    except Exception:
-                        continue
-                await asyncio.sleep(0.01)
+            async for msg in self._pubsub.listen():  # type: ignore
+                if msg["type"] != "message":
+                    continue
+                try:
+                    yield model.model_validate_json(msg["data"])  # type: ignore
+                except Exception:
+                    continue
         finally:
             await self.unsub(channel)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from quipubase.lib.utils import encrypt, get_logger
+from quipubase.lib.utils import get_logger
 
 from .service import CollectionManager
 from .typedefs import (CollectionMetadataType, CollectionType,
@@ -22,11 +22,7 @@ def route() -> APIRouter:
         data: JsonSchemaModel,
     ):
         """Create a new collection"""
-        try:
-            collection_id = encrypt(data.model_dump_json())
-            return await manager.get_collection(col_id=collection_id)
-        except:
-            return await manager.create_collection(data=data)
+        return await manager.create_collection(data=data)
 
     @router.get("", response_model=list[CollectionMetadataType])
     async def _():
@@ -1,12 +1,15 @@
 import json
+import uuid
+from datetime import datetime, timezone
 from typing import Type
 
+import orjson
 from fastapi import HTTPException, status
 from prisma.models import CollectionModel as collection
 
 from prisma import Json
 from quipubase.lib.exceptions import QuipubaseException
-from quipubase.lib.utils import encrypt, get_logger, singleton
+from quipubase.lib.utils import get_logger, singleton
 
 from .typedefs import (Collection, CollectionType, DeleteCollectionReturnType,
                        JsonSchema, JsonSchemaModel)
@@ -19,6 +22,7 @@ class CollectionManager:
     """Singleton for managing collection classes and exchanges"""
 
     def __init__(self):
+        self.classes: dict[str, Type[Collection]] = {}
         try:
             self.db = collection.prisma()
         except Exception as e:
@@ -30,6 +34,8 @@ class CollectionManager:
 
     async def retrieve_collection(self, collection_id: str) -> Type[Collection]:
         """Get or create a collection class for a given collection ID"""
+        if collection_id in self.classes:
+            return self.classes[collection_id]
         try:
             data = await self.db.find_unique(where={"id": collection_id})
             if not data:
@@ -38,12 +44,13 @@ class CollectionManager:
                     detail=f"Collection '{collection_id}' not found",
                 )
 
-            json_schema = json.loads(data.json_schema)
+            json_schema = orjson.loads(data.json_schema)
             klass = JsonSchemaModel(**json_schema).create_class()
+            self.classes[collection_id] = klass
             logger.info(f"Successfully retrieved collection '{collection_id}'")
             return klass
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 f"Failed to decode JSON for collection '{collection_id}': {str(e)}"
             )
@@ -68,14 +75,14 @@ class CollectionManager:
                     detail=f"Collection '{collection_id}' not found",
                 )
 
-            json_schema = json.loads(data.json_schema)
+            json_schema = orjson.loads(data.json_schema)
             schema_model = JsonSchemaModel(**json_schema)
             logger.info(
                 f"Successfully retrieved schema for collection '{collection_id}'"
             )
             return schema_model
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 f"Failed to decode JSON schema for collection '{collection_id}': {str(e)}"
             )
@@ -105,15 +112,18 @@ class CollectionManager:
             )
 
     async def get_collection(self, *, col_id: str) -> CollectionType:
-        """Retrieve a collection class by ID"""
+        """Retrieve a collection by ID"""
         try:
-            klass = await self.retrieve_collection(col_id)
-            sha = klass.col_id()
-            col = await self.db.find_unique_or_raise(where={"sha": sha})
+            col = await self.db.find_unique(where={"id": col_id})
+            if not col:
+                raise QuipubaseException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Collection '{col_id}' not found",
+                )
             return {
                 "id": col.id,
                 "sha": col.sha,
-                "schema": JsonSchema(**json.loads(col.json_schema)),
+                "schema": JsonSchema(**orjson.loads(col.json_schema)),
             }
         except QuipubaseException as e:
             logger.error(f"Failed to get collection '{col_id}': {str(e)}")
@@ -126,6 +136,7 @@ class CollectionManager:
             if not await self.db.find_unique(where={"id": col_id}):
                 return {"code": 1}
             await self.db.delete(where={"id": col_id})
+            self.classes.pop(col_id, None)
             return {"code": 0}
         except HTTPException as e:
             logger.error(f"Failed to delete collection '{col_id}': {str(e)}")
@@ -136,27 +147,23 @@ class CollectionManager:
 
     async def create_collection(self, *, data: JsonSchemaModel) -> CollectionType:
         """Create a new collection"""
-        sha = encrypt(json.dumps(JsonSchema(**data.model_dump())))
+        # Collections are keyed by the digest of their generated schema
+        klass = data.create_class()
+        sha = klass.col_id()
         col = await self.db.find_unique(where={"sha": sha})
         if col is not None:
-            klass = await self.retrieve_collection(col.id)
             return {
                 "sha": col.sha,
                 "id": col.id,
-                "schema": JsonSchema(**klass.model_json_schema()),
+                "schema": JsonSchema(**orjson.loads(col.json_schema)),
             }
+        json_schema = klass.col_schema()
         try:
-            # Create collection class
-            klass = data.create_class()
-            sha = klass.col_id()
-            import uuid
-            from datetime import datetime, timezone
-
             col = await self.db.create(
                 data={
                     "id": str(uuid.uuid4()),
                     "sha": sha,
-                    "json_schema": Json(json.dumps(klass.model_json_schema())),
+                    "json_schema": Json(json.dumps(json_schema)),
                     "updated_at": datetime.now(timezone.utc),
                 }
             )
@@ -171,5 +178,5 @@ class CollectionManager:
         return {
             "sha": col.sha,
             "id": col.id,
-            "schema": JsonSchema(**klass.model_json_schema()),
+            "schema": JsonSchema(**json_schema),
         }
@@ -1,8 +1,10 @@
 """Data Modelation module"""
 
+import copy
 import json
 import os
 import typing as tp
+from functools import cache
 from pathlib import Path
 from uuid import uuid4
 
@@ -13,6 +15,7 @@ from rocksdict import Options  # pylint: disable=E0611
 from rocksdict import PlainTableFactoryOptions  # pylint: disable=E0611
 from rocksdict import Rdict, SliceTransform
 
+from quipubase.lib.storage import open_db
 from quipubase.lib.utils import encrypt, get_logger, handle
 
 T = tp.TypeVar("T", bound="Collection")
@@ -30,6 +33,8 @@ MAPPING: dict[str, tp.Type[tp.Any]] = {
     "null": type(None),
 }
 
+CLASSES: dict[str, tp.Type["Collection"]] = {}
+
 QuipuActions: tpe.TypeAlias = tp.Literal[
     "create", "read", "update", "delete", "query", "stop"
 ]
@@ -124,6 +129,9 @@ class JsonSchemaModel(BaseModel):
 
     def create_class(self):
         """Create a class based on the schema with recursion control"""
+        model_name = f"{self.title}::{encrypt(self.model_dump_json(exclude_none=True))}"
+        if model_name in CLASSES:
+            return CLASSES[model_name]
         attributes: tp.Dict[str, tp.Any] = {}
         for key, prop_schema in self.properties.items():
             is_required = self.required and key in self.required
@@ -134,8 +142,9 @@ class JsonSchemaModel(BaseModel):
             else:
                 attributes[key] = (tp.Optional[field_type], Field(default=None))
 
-        model_name = f"{self.title}::{encrypt(self.model_dump_json(exclude_none=True))}"
-        return create_model(model_name, __base__=Collection, **attributes)
+        klass = create_model(model_name, __base__=Collection, **attributes)
+        CLASSES[model_name] = klass
+        return klass
 
     def cast_to_type(self) -> tp.Any:
         """Cast the schema to the corresponding Python type"""
@@ -206,6 +215,9 @@ class Collection(BaseModel):
         col_path() -> str:
             Get the absolute path to the collection directory.
 
+        col_schema() -> dict[str, Any]:
+            A copy of the JSON schema of this collection, generated once per class.
+
         col_json_schema() -> JsonSchemaModel:
             Create and persist a JSON schema for this collection.
 
@@ -259,24 +271,34 @@ class Collection(BaseModel):
     @classmethod
     def db(cls) -> Rdict:
         """Get or create a RocksDB instance for this collection."""
-        return Rdict(cls.col_path(), cls.options())
+        return open_db(cls.col_path(), cls.options)
 
     @classmethod
     def col_path(cls):
         """The absolute path to the collection directory."""
-        base_dir = Path("./data/collections").as_posix()
-        if not os.path.exists(os.path.join(base_dir, cls.col_id())):
-            os.makedirs(os.path.join(base_dir, cls.col_id()), exist_ok=True)
+        base_dir = os.environ.get("COLLECTIONS_DIR", "./data/collections")
         return os.path.join(base_dir, cls.col_id())
 
     @classmethod
+    @cache
     def col_id(cls):
-        return encrypt(json.dumps(cls.model_json_schema(), sort_keys=True))
+        return encrypt(json.dumps(cls._col_schema(), sort_keys=True))
+
+    @classmethod
+    @cache
+    def _col_schema(cls) -> dict[str, tp.Any]:
+        """The JSON schema of this collection, generated once per class."""
+        return cls.model_json_schema()
+
+    @classmethod
+    def col_schema(cls) -> dict[str, tp.Any]:
+        """A copy of the JSON schema of this collection, safe to modify."""
+        return copy.deepcopy(cls._col_schema())
 
     @classmethod
     def col_json_schema(cls) -> JsonSchemaModel:
         """Create a schema for this collection"""
-        return JsonSchemaModel(**cls.model_json_schema())
+        return JsonSchemaModel(**cls.col_schema())
 
     @classmethod
     def cpu_count(cls):
@@ -291,7 +313,7 @@ class Collection(BaseModel):
             "function": {
                 "name": cls.__name__,
                 "description": cls.__doc__ or "",
-                "parameters": cls.model_json_schema().get("properties", {}),
+                "parameters": cls.col_schema().get("properties", {}),
             },
         }
 
@@ -299,7 +321,7 @@ class Collection(BaseModel):
     def tool_anthropic(cls) -> dict[str, tp.Any]:
         """Generate tool parameters for `Anthropic` function calling."""
         return {
-            "input_schema": cls.model_json_schema(),
+            "input_schema": cls.col_schema(),
             "name": cls.__name__,
             "description": cls.__doc__ or "",
             "cache_control": {"type": "ephemeral"},
@@ -337,6 +359,7 @@ class Collection(BaseModel):
             self.id = str(uuid4())
         data = self.model_dump_json(exclude_none=True).encode("utf-8")
         self.db().put(self.id, data)  # pylint: disable=E1101
+        self.db().flush_wal(True)
         assert (
             self.db().get(self.id) == data  # pylint: disable=E1101
         ), f"Failed to persist record {self.id}"
@@ -347,6 +370,7 @@ class Collection(BaseModel):
         """Delete a record by ID."""
         try:
             cls.db().delete(id)
+            cls.db().flush_wal(True)
             return True
         except KeyError:
             return False
@@ -366,6 +390,15 @@ class Collection(BaseModel):
         Yields:
             Matching model instances
         """
+        criteria = [(k, v) for k, v in kwargs.items() if k != "id"]
+        if "id" in kwargs:
+            # Records are keyed by id, so this is a point lookup, not a scan
+            raw_data = cls.db().get(kwargs["id"])
+            if raw_data is not None and offset == 0 and limit > 0:
+                data = orjson.loads(raw_data)  # pylint: disable=E1101
+                if all(data.get(k) == v for k, v in criteria):
+                    yield cls.model_validate(data)
+            return
         riter = cls.db().iter()
         riter.seek_to_first()
 
@@ -378,7 +411,7 @@ class Collection(BaseModel):
         while riter.valid() and limit > 0:
             try:
                 data = orjson.loads(riter.value())  # pylint: disable=E1101
-                if all(data.get(k) == v for k, v in kwargs.items() if k != "id"):
+                if all(data.get(k) == v for k, v in criteria):
                     yield cls.model_validate(data)
                     limit -= 1
             except Exception as e:  # pylint: disable=W0718
@@ -407,7 +440,7 @@ class Collection(BaseModel):
 
     @classmethod
     def init(cls):
-        data = cls.model_json_schema()
+        data = cls.col_schema()
         if not os.path.exists(cls.col_path()):
             os.makedirs(cls.col_path(), exist_ok=True)
         schema_json_path = Path(cls.col_path()) / "schema.json"
@@ -1,13 +1,17 @@
+import base64
 import time
+import typing as tp
 
-import numpy as np
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from quipubase.lib.exceptions import QuipubaseException
+from quipubase.lib.utils import encrypt
 
 from .services import VectorStoreService
-from .typedefs import (DeleteResponse, DeleteText, Embedding, EmbedResponse,
-                       EmbedText, QueryResponse, QueryText, UpsertResponse)
+from .typedefs import (Base64Embedding, Base64EmbedResponse, DeleteResponse,
+                       DeleteText, Embedding, EmbedResponse, EmbedText,
+                       QueryResponse, QueryText, UpsertResponse)
 
 
 def route() -> APIRouter:
@@ -15,7 +19,17 @@ def route() -> APIRouter:
 
     @app.get("/vector/{namespace}/{id}")
     def _(namespace: str, id: str):
-        return Embedding.retrieve(namespace=namespace, id=id)
+        embedding = Embedding.retrieve(namespace=namespace, id=id)
+        if embedding is None:
+            return ORJSONResponse(None)
+        # orjson serializes the float32 array natively, skipping list conversion
+        return ORJSONResponse(
+            {
+                "content": embedding.content,
+                "embedding": embedding.embedding,
+                "id": embedding.id,
+            }
+        )
 
     @app.post("/vector/{namespace}", response_model=UpsertResponse)
     def _(namespace: str, data: EmbedText):
@@ -49,6 +63,7 @@ def route() -> APIRouter:
                 namespace: The namespace to query
                 query: The text query to search for similar content
                 top_k: Number of results to return
+                ef_search: HNSW candidate list size, trading latency for recall
                 model: The embedding model to use
 
         Returns:
@@ -56,7 +71,7 @@ def route() -> APIRouter:
         """
         try:
             store = VectorStoreService(namespace=namespace, model=data.model)
-            return store.query(store.embed(data.input).tolist(), data.top_k)
+            return store.query(store.embed(data.input), data.top_k, data.ef_search)
         except Exception as e:
             raise QuipubaseException(status_code=500, detail=str(e))
 
@@ -82,16 +97,34 @@ def route() -> APIRouter:
         except Exception as e:
             raise QuipubaseException(status_code=500, detail=str(e))
 
-    @app.post("/embeddings", response_model=EmbedResponse)
+    @app.post(
+        "/embeddings", response_model=tp.Union[EmbedResponse, Base64EmbedResponse]
+    )
     def _(data: EmbedText):
         start = time.perf_counter()
         vs = VectorStoreService(namespace="quipubase", model=data.model)
-        embeddings: list[list[float]] = vs.embed(data.input).tolist()
+        texts = [data.input] if isinstance(data.input, str) else data.input
+        embeddings = vs.embed(texts)
         end = time.perf_counter()
+        if data.encoding_format == "base64":
+            # Returned directly: the payload is plain strings, nothing to validate
+            return ORJSONResponse(
+                Base64EmbedResponse(
+                    data=[
+                        Base64Embedding(
+                            content=c,
+                            embedding=base64.b64encode(e.tobytes()).decode(),
+                            id=encrypt(c),
+                        )
+                        for c, e in zip(texts, embeddings)
+                    ],
+                    ellapsed=end - start,
+                    count=len(embeddings),
+                )
+            )
         return EmbedResponse(
             data=[
-                Embedding(content=c, embedding=np.array(e).astype(np.float32))
-                for c, e in zip(data.input, embeddings)
+                Embedding(content=c, embedding=e) for c, e in zip(texts, embeddings)
             ],
             ellapsed=end - start,
             count=len(embeddings),
@@ -1,4 +1,5 @@
 from .embeddings import EmbeddingService
+from .index import VectorIndex
 from .vector_store import VectorStoreService
 
-__all__ = ["EmbeddingService", "VectorStoreService"]
+__all__ = ["EmbeddingService", "VectorIndex", "VectorStoreService"]
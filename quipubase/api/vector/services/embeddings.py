@@ -3,32 +3,32 @@ Embedding Service Implementation
 =============================
 
 This module provides the embedding service implementation for generating vector
-representations of text data and performing similarity searches. It supports
-multiple embedding models and provides efficient vector operations.
+representations of text data. It supports multiple embedding models and provides
+efficient vector operations.
 
 Key Features:
 - Multiple embedding model support
 - Efficient vector operations
-- Similarity search using FAISS
 - Text embedding generation
 
 Dependencies:
 - numpy: For numerical operations and array handling
-- faiss: For efficient similarity search
 - light_embed: For embedding model management
 """
 
 import functools as ft
+import hashlib
+import threading
 import typing as tp
 from dataclasses import dataclass
 
-import faiss  # type: ignore
 import numpy as np
 import typing_extensions as tpx
+from cachetools import LRUCache
 from light_embed import TextEmbedding  # type: ignore
 from numpy.typing import NDArray
 
-from ..typedefs import Embedding, EmbeddingModel, QueryMatch, Semantic
+from ..typedefs import EmbeddingModel, Semantic
 
 Texts: tpx.TypeAlias = tp.Union[str, list[str]]
 
@@ -39,11 +39,33 @@ MODELS: dict[EmbeddingModel, str] = {
     "mini-scope": "sentence-transformers/all-MiniLM-L6-v2",
 }
 
+# Keyed by a 16-byte digest so that large documents are not retained
+EMBEDDINGS: LRUCache[tuple[EmbeddingModel, bytes], NDArray[np.float32]] = LRUCache(
+    maxsize=8192
+)
+EMBEDDINGS_LOCK = threading.Lock()
+
+
+@ft.cache
+def load_model(model: EmbeddingModel) -> TextEmbedding:
+    """
+    Load an embedding model once per process and keep it resident.
+
+    Args:
+            model (EmbeddingModel): The embedding model to load
+
+    Returns:
+            TextEmbedding: The shared embedding model client
+    """
+    return TextEmbedding(
+        MODELS[model],  # type: ignore
+    )
+
 
 @dataclass
 class EmbeddingService(tp.Hashable):
     """
-    Service for generating vector representations and performing similarity searches.
+    Service for generating vector representations of text.
 
     Args:
             model (EmbeddingModel): The embedding model to use
@@ -54,7 +76,7 @@ class EmbeddingService(tp.Hashable):
 
     model: EmbeddingModel
 
-    @ft.cached_property
+    @property
     def client(self) -> TextEmbedding:
         """
         Get the embedding model client.
@@ -62,13 +84,12 @@ class EmbeddingService(tp.Hashable):
         Returns:
                 TextEmbedding: The embedding model client instance
         """
-        return TextEmbedding(
-            MODELS[self.model],  # type: ignore
-        )
+        return load_model(self.model)
 
     def encode(self, data: Texts) -> NDArray[np.float32]:
         """
-        Generate embeddings for text.
+        Generate embeddings for text, reusing cached vectors for texts already
+        embedded with the same model.
 
         Args:
                 data (str | list[str]): Text or list of texts to embed
@@ -88,10 +109,31 @@ class EmbeddingService(tp.Hashable):
                 0, 768 if self.model != "mini-scope" else 384
             )
 
-        raw_output = self.client.encode(data)  # type: ignore
-        return np.asarray(
-            raw_output, dtype=np.float32
-        )  # force conversion if not ndarray
+        keys = [
+            (self.model, hashlib.blake2b(text.encode(), digest_size=16).digest())
+            for text in data
+        ]
+        with EMBEDDINGS_LOCK:
+            cached = [EMBEDDINGS.get(key) for key in keys]
+        missing = {
+            key: text
+            for key, text, vector in zip(keys, data, cached)
+            if vector is None
+        }
+        if missing:
+            raw_output = self.client.encode(list(missing.values()))  # type: ignore
+            vectors = np.asarray(
+                raw_output, dtype=np.float32
+            )  # force conversion if not ndarray
+            encoded = dict(zip(missing, vectors))
+            with EMBEDDINGS_LOCK:
+                for key, vector in encoded.items():
+                    EMBEDDINGS[key] = vector.copy()
+            cached = [
+                encoded[key] if vector is None else vector
+                for key, vector in zip(keys, cached)
+            ]
+        return np.stack(cached)  # type: ignore
 
     def semantic_to_numpy(self, semantic: Semantic) -> NDArray[np.float32]:
         """
@@ -119,44 +161,3 @@ class EmbeddingService(tp.Hashable):
                 0, 768 if self.model != "mini-scope" else 384
             )
         return semantic
-
-    def search(
-        self,
-        query: list[float],
-        corpus: list[Embedding],
-        top_k: int = 3,
-    ) -> list[QueryMatch]:
-        if not corpus:
-            return []
-
-        corpus_embeddings = np.array([c.embedding for c in corpus], dtype=np.float32)
-        corpus_embeddings = corpus_embeddings.reshape(len(corpus), -1)
-        query_embedding = np.array(query, dtype=np.float32).reshape(1, -1)
-        dimension = corpus_embeddings.shape[1]
-
-        # Normalize the query and corpus embeddings
-        def normalize(vectors: tp.Any):
-            norms = np.linalg.norm(vectors, axis=1, keepdims=True)  # type: ignore
-            return vectors / norms  # type: ignore
-
-        normalized_query = normalize(query_embedding)
-        normalized_corpus = normalize(corpus_embeddings)
-
-        # Build the Faiss index for inner product search
-        index = faiss.IndexFlatIP(dimension)
-        index.add(normalized_corpus)  # type: ignore
-
-        # Perform the search for top_k results
-        distances, indices = index.search(normalized_query, min(top_k, len(corpus)))  # type: ignore
-
-        # Prepare the results as a list of dictionaries
-        results: list[QueryMatch] = []
-        for i in range(len(distances[0])):  # type: ignore
-            result_dict = QueryMatch(
-                id=corpus[indices[0][i]].id,  # type: ignore
-                score=distances[0][i],  # type: ignore
-                content=corpus[indices[0][i]].content,  # type: ignore
-            )
-            results.append(result_dict)
-
-        return results
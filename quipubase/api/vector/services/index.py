@@ -0,0 +1,196 @@
+"""
+Vector Index Implementation
+=========================
+
+This module keeps an in-memory approximate nearest neighbour index per namespace,
+so similarity queries no longer rebuild a FAISS index from a full RocksDB scan on
+every request. Raw vectors stay in RocksDB and the index is rebuilt from them
+when needed.
+
+Indexes are immutable snapshots: upserts produce a new snapshot that shares the
+HNSW graph and carries the new vectors in a small pending tail, scored exactly at
+query time, and deletes produce one that tombstones the removed ids. Readers never
+see a graph being mutated, and the graph is only rebuilt once the tail grows past
+`PENDING_LIMIT` or tombstones exceed `TOMBSTONE_RATIO` of the indexed rows.
+
+Key Features:
+- HNSW graph index with cosine similarity (inner product over unit vectors)
+- Vectors normalized once when indexed, so scoring is a single dot product
+- Pending tail for cheap writes, merged with graph results at query time
+- Tombstones for O(1) deletes, filtered out at query time
+- Per-query recall/latency trade-off through `ef_search`
+
+Dependencies:
+- numpy: For numerical operations and array handling
+- faiss: For the HNSW graph index
+"""
+
+import typing as tp
+from dataclasses import dataclass, field, replace
+
+import faiss  # type: ignore
+import numpy as np
+from numpy.typing import NDArray
+
+from ..typedefs import Embedding, QueryMatch
+
+HNSW_M: int = 16
+EF_CONSTRUCTION: int = 64
+EF_SEARCH: int = 40
+PENDING_LIMIT: int = 1024
+TOMBSTONE_RATIO: float = 0.25
+
+
+def _normalize(embeddings: list[Embedding]) -> NDArray[np.float32]:
+    vectors = np.array([e.embedding for e in embeddings], dtype=np.float32)
+    vectors = np.ascontiguousarray(vectors.reshape(len(embeddings), -1))
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+@dataclass(frozen=True)
+class VectorIndex:
+    """
+    Snapshot of the similarity index for a single namespace.
+
+    Attributes:
+        ids (list[str]): Embedding ids, by graph row
+        contents (list[str | list[str]]): Embedding contents, by graph row
+        index (faiss.IndexHNSWFlat | None): Graph index, None if nothing was indexed
+        pending_ids (list[str]): Ids upserted since the graph was built
+        pending_contents (list[str | list[str]]): Contents upserted since the graph was built
+        pending (NDArray[np.float32] | None): Unit vectors upserted since the graph was built
+        deleted (frozenset[str]): Ids deleted since the graph was built
+    """
+
+    ids: list[str]
+    contents: list[tp.Union[str, list[str]]]
+    index: tp.Optional[faiss.IndexHNSWFlat]
+    pending_ids: list[str] = field(default_factory=list)
+    pending_contents: list[tp.Union[str, list[str]]] = field(default_factory=list)
+    pending: tp.Optional[NDArray[np.float32]] = None
+    deleted: frozenset[str] = frozenset()
+
+    @classmethod
+    def build(cls, corpus: list[Embedding]) -> "VectorIndex":
+        """
+        Build the index from the stored embeddings of a namespace.
+
+        Args:
+            corpus (list[Embedding]): Embeddings to index
+
+        Returns:
+            VectorIndex: The populated index
+        """
+        if not corpus:
+            return cls(ids=[], contents=[], index=None)
+        vectors = _normalize(corpus)
+        index = faiss.IndexHNSWFlat(vectors.shape[1], HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = EF_CONSTRUCTION
+        index.add(vectors)  # type: ignore
+        return cls(
+            ids=[c.id for c in corpus],
+            contents=[c.content for c in corpus],
+            index=index,
+        )
+
+    def append(self, embeddings: list[Embedding]) -> "VectorIndex":
+        """
+        Return a new snapshot with the embeddings added to the pending tail.
+
+        Args:
+            embeddings (list[Embedding]): Embeddings just written to storage
+
+        Returns:
+            VectorIndex: The new snapshot, sharing this snapshot's graph
+
+        Raises:
+            ValueError: If the embeddings do not match the index dimension
+        """
+        vectors = _normalize(embeddings)
+        if self.index is not None and self.index.d != vectors.shape[1]:
+            raise ValueError(
+                f"Expected dimension {self.index.d}, got {vectors.shape[1]}"
+            )
+        ids = [e.id for e in embeddings]
+        return replace(
+            self,
+            pending_ids=self.pending_ids + ids,
+            pending_contents=self.pending_contents + [e.content for e in embeddings],
+            pending=(
+                vectors if self.pending is None else np.vstack([self.pending, vectors])
+            ),
+            deleted=self.deleted.difference(ids),
+        )
+
+    def remove(self, ids: list[str]) -> "VectorIndex":
+        """
+        Return a new snapshot with the ids tombstoned.
+
+        Args:
+            ids (list[str]): Ids just deleted from storage
+
+        Returns:
+            VectorIndex: The new snapshot, sharing this snapshot's graph and tail
+        """
+        return replace(self, deleted=self.deleted.union(ids))
+
+    @property
+    def stale(self) -> bool:
+        """Whether the pending tail or tombstones have grown enough to rebuild."""
+        size = len(self.ids) + len(self.pending_ids)
+        return (
+            len(self.pending_ids) > PENDING_LIMIT
+            or len(self.deleted) > TOMBSTONE_RATIO * size
+        )
+
+    def search(
+        self,
+        query: NDArray[np.float32],
+        top_k: int = 3,
+        ef_search: int = EF_SEARCH,
+    ) -> list[QueryMatch]:
+        """
+        Find the embeddings most similar to the query vector.
+
+        Args:
+            query (NDArray[np.float32]): Query vector
+            top_k (int): Number of results to return
+            ef_search (int): HNSW candidate list size, higher is more accurate
+
+        Returns:
+            list[QueryMatch]: Matches ordered by descending cosine similarity
+        """
+        query = np.array(query, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(query)
+        candidates: dict[str, tuple[float, tp.Union[str, list[str]]]] = {}
+        # Over-fetch so that tombstoned rows cannot crowd out live ones
+        fetch = top_k + len(self.deleted)
+        if self.pending is not None:
+            scores = self.pending @ query[0]
+            # Candidates are ranked after the merge, so an O(n) partition suffices
+            top = (
+                np.argpartition(scores, -fetch)[-fetch:]
+                if fetch < len(scores)
+                else range(len(scores))
+            )
+            for i in top:
+                if self.pending_ids[i] not in self.deleted:
+                    candidates[self.pending_ids[i]] = (
+                        float(scores[i]),
+                        self.pending_contents[i],
+                    )
+        if self.index is not None:
+            k = min(fetch, len(self.ids))
+            params = faiss.SearchParametersHNSW(efSearch=max(ef_search, k))
+            distances, indices = self.index.search(query, k, params=params)  # type: ignore
+            for score, i in zip(distances[0], indices[0]):  # type: ignore
+                if i == -1 or self.ids[i] in self.deleted:
+                    continue
+                if self.ids[i] not in candidates:
+                    candidates[self.ids[i]] = (float(score), self.contents[i])
+        ranked = sorted(candidates.items(), key=lambda c: c[1][0], reverse=True)
+        return [
+            QueryMatch(id=id, score=min(score, 1.0), content=content)  # type: ignore
+            for id, (score, content) in ranked[:top_k]
+        ]
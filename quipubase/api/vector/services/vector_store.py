@@ -8,9 +8,9 @@ retrieving, and searching vector data.
 
 Key Features:
 - Persistent storage using RocksDB
-- Vector similarity search
+- Vector similarity search over a cached HNSW index
 - Embedding generation using configurable models
-- Batch operations for efficient data management
+- Batch operations for efficient data management (single RocksDB write batch)
 
 Dependencies:
 - numpy: For numerical operations and array handling
@@ -18,6 +18,7 @@ Dependencies:
 - pydantic: For data validation and serialization
 """
 
+import threading
 import time
 import typing as tp
 from dataclasses import dataclass
@@ -29,6 +30,14 @@ from numpy.typing import NDArray
 from ..typedefs import (DeleteResponse, Embedding, QueryResponse,
                         SemanticContent, UpsertResponse)
 from .embeddings import EmbeddingModel, EmbeddingService
+from .index import EF_SEARCH, VectorIndex
+
+# Process-local: writes from other workers are never seen, so this assumes a
+# single worker per data directory.
+INDEXES: dict[str, VectorIndex] = {}
+# Bumped on every write, so a build that raced a write is not cached
+VERSIONS: dict[str, int] = {}
+INDEXES_LOCK = threading.Lock()
 
 
 @dataclass
@@ -59,6 +68,26 @@ class VectorStoreService(tp.Hashable):
         """
         return EmbeddingService(self.model)
 
+    @property
+    def index(self) -> VectorIndex:
+        """
+        Get the namespace index, building it from storage if it is not cached.
+
+        Returns:
+            VectorIndex: HNSW index over the namespace embeddings
+        """
+        index = INDEXES.get(self.namespace)
+        if index is not None:
+            return index
+        with INDEXES_LOCK:
+            version = VERSIONS.get(self.namespace, 0)
+        # Scan and build without the lock so writers and other namespaces never wait
+        index = VectorIndex.build(self.scan())
+        with INDEXES_LOCK:
+            if VERSIONS.get(self.namespace, 0) == version:
+                return INDEXES.setdefault(self.namespace, index)
+        return index
+
     def upsert(self, vectors: list[Embedding]) -> UpsertResponse:
         """
         Insert or update embeddings in the store.
@@ -75,23 +104,29 @@ class VectorStoreService(tp.Hashable):
             ... ])
         """
         start = time.perf_counter()
-        embeddings: list[Embedding] = []
-        for vector in vectors:
-            embeddings.append(
-                Embedding(content=vector.content, embedding=vector.embedding)
-            )
-        for embedding in embeddings:
-            embedding.create(namespace=self.namespace)
+        Embedding.create_many(vectors, namespace=self.namespace)
+        with INDEXES_LOCK:
+            VERSIONS[self.namespace] = VERSIONS.get(self.namespace, 0) + 1
+            index = INDEXES.get(self.namespace)
+            try:
+                if index is not None and vectors:
+                    index = index.append(vectors)
+            except ValueError:
+                index = None
+            if index is None or index.stale:
+                INDEXES.pop(self.namespace, None)
+            else:
+                INDEXES[self.namespace] = index
         data = [
             SemanticContent(
                 id=embedding.id,
                 content=embedding.content,
             )
-            for embedding in embeddings
+            for embedding in vectors
         ]
         return UpsertResponse(
             data=data,
-            count=len(embeddings),
+            count=len(vectors),
             ellapsed=time.perf_counter() - start,
         )
 
@@ -126,6 +161,15 @@ class VectorStoreService(tp.Hashable):
         start = time.perf_counter()
         for id in ids:
             Embedding.delete(id=id, namespace=self.namespace)
+        with INDEXES_LOCK:
+            VERSIONS[self.namespace] = VERSIONS.get(self.namespace, 0) + 1
+            index = INDEXES.get(self.namespace)
+            if index is not None:
+                index = index.remove(ids)
+            if index is None or index.stale:
+                INDEXES.pop(self.namespace, None)
+            else:
+                INDEXES[self.namespace] = index
         return DeleteResponse(
             data=ids, count=len(ids), ellapsed=time.perf_counter() - start
         )
@@ -144,13 +188,19 @@ class VectorStoreService(tp.Hashable):
             text = [text]
         return self.embedding_service.encode(text)
 
-    def query(self, query_vector: list[float], top_k: int = 3):
+    def query(
+        self,
+        query_vector: NDArray[np.float32],
+        top_k: int = 3,
+        ef_search: int = EF_SEARCH,
+    ):
         """
         Perform a similarity search using cosine similarity.
 
         Args:
-            query_vector (list[float] | NDArray[np.float32]): Query vector
+            query_vector (NDArray[np.float32]): Query vector
             top_k (int): Number of top results to return (default: 3)
+            ef_search (int): HNSW candidate list size (default: 40)
 
         Returns:
             QueryResponse: Response containing matches and read count
@@ -160,8 +210,7 @@ class VectorStoreService(tp.Hashable):
             >>> response = store.query(query_vector, top_k=5)
         """
         start = time.perf_counter()
-        corpus = list(Embedding.scan(namespace=self.namespace))
-        matches = self.embedding_service.search(query_vector, corpus, top_k)
+        matches = self.index.search(query_vector, top_k, ef_search)
         return QueryResponse(
             data=matches, count=len(matches), ellapsed=time.perf_counter() - start
         )
@@ -18,7 +18,6 @@ Dependencies:
 - rocksdict: For persistent storage
 """
 
-import os
 import typing as tp
 
 import numpy as np
@@ -27,8 +26,9 @@ import typing_extensions as tpe
 from numpy.typing import NDArray
 from pydantic import (BaseModel, WithJsonSchema, computed_field,
                       field_serializer, field_validator)
-from rocksdict import Rdict
+from rocksdict import WriteBatch
 
+from quipubase.lib.storage import open_db
 from quipubase.lib.utils import encrypt, handle
 
 DIR: str = "./data"
@@ -36,6 +36,7 @@ EMB: str = "/embeddings/"
 
 Texts: tpe.TypeAlias = tp.Union[str, list[str]]
 EmbeddingModel: tpe.TypeAlias = tp.Literal["poly-sage", "deep-pulse", "mini-scope"]
+EncodingFormat: tpe.TypeAlias = tp.Literal["float", "base64"]
 Semantic: tpe.TypeAlias = tp.Union[Texts, NDArray[np.float32]]
 
 
@@ -95,10 +96,7 @@ class Embedding(BaseModel):
 
     @classmethod
     def db(cls, *, namespace: str):
-        os.makedirs(f"{DIR}/", exist_ok=True)
-        if not os.path.exists(f"{DIR}{EMB}{namespace}"):
-            os.makedirs(f"{DIR}{EMB}{namespace}", exist_ok=True)
-        return Rdict(f"{DIR}{EMB}{namespace}")
+        return open_db(f"{DIR}{EMB}{namespace}")
 
     @classmethod
     @handle
@@ -109,22 +107,28 @@ class Embedding(BaseModel):
             return None
         return cls(**orjson.loads(item))
 
-    @handle
     def create(self, *, namespace: str):
-        db = self.db(namespace=namespace)
-        if db.key_may_exist(self.id):
-            data = db.get(self.id)
-            if data is None:
-                db[self.id] = self.model_dump_json()
-        db[self.id] = self.model_dump_json()
+        self.create_many([self], namespace=namespace)
         return self
 
+    @classmethod
+    @handle
+    def create_many(cls, embeddings: list["Embedding"], *, namespace: str):
+        db = cls.db(namespace=namespace)
+        batch = WriteBatch()
+        for embedding in embeddings:
+            batch.put(embedding.id, embedding.model_dump_json())
+        db.write(batch)
+        db.flush_wal(True)
+        return embeddings
+
     @classmethod
     @handle
     def delete(cls, *, id: str, namespace: str):
         db = cls.db(namespace=namespace)
         if db.key_may_exist(id):
             del db[id]
+            db.flush_wal(True)
 
     @classmethod
     def scan(cls, *, namespace: str):
@@ -169,6 +173,8 @@ class EmbedText(BaseModel):
     Attributes:
         content (list[str]): List of text strings to be embedded
         model (EmbeddingModel): Model type for generating embeddings
+        encoding_format (EncodingFormat): How `/embeddings` returns vectors, either
+            float lists or base64 of the little-endian float32 bytes
     """
 
     model_config = {
@@ -198,6 +204,7 @@ class EmbedText(BaseModel):
 
     input: list[str] | str
     model: EmbeddingModel
+    encoding_format: EncodingFormat = "float"
 
 
 class QueryText(EmbedText):
@@ -210,11 +217,13 @@ class QueryText(EmbedText):
                     "model": "poly-sage",
                     "namespace": "quipubase",
                     "top_k": 5,
+                    "ef_search": 40,
                 }
             ],
         }
     }
     top_k: int
+    ef_search: int = 40
 
 
 class DeleteText(BaseModel):
@@ -281,3 +290,24 @@ class EmbedResponse(tpe.TypedDict):
     data: list[Embedding]
     count: int
     ellapsed: float
+
+
+class Base64Embedding(tpe.TypedDict):
+    """
+    Embedding returned with `encoding_format="base64"`.
+
+    Fields:
+        content (str): Text content
+        embedding (str): Base64 of the little-endian float32 vector bytes
+        id (str): Unique identifier
+    """
+
+    content: str
+    embedding: str
+    id: str
+
+
+class Base64EmbedResponse(tpe.TypedDict):
+    data: list[Base64Embedding]
+    count: int
+    ellapsed: float
@@ -1,6 +1,7 @@
 from .cache import cache, load_cache
 from .common import setup
 from .exceptions import QuipubaseException
+from .storage import open_db
 from .utils import asyncify, get_key, get_logger, handle, is_base64
 
 cache_store = load_cache()
@@ -15,4 +16,5 @@ __all__ = [
     "handle",
     "get_key",
     "is_base64",
+    "open_db",
 ]
@@ -30,6 +30,7 @@ def load_cache():
 def cache(ttl: int = 60 * 60 * 24 * 7):
     def decorator(func: tp.Callable[P, tp.Awaitable[T] | T]):
         db = load_cache()
+        is_coroutine = asyncio.iscoroutinefunction(func)
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
@@ -40,7 +41,7 @@ def cache(ttl: int = 60 * 60 * 24 * 7):
 
             result = (
                 await func(*args, **kwargs)
-                if asyncio.iscoroutinefunction(func)
+                if is_coroutine
                 else func(*args, **kwargs)
             )
             await db.set(key, orjson.dumps(result), ex=ttl)  # type: ignore
@@ -0,0 +1,35 @@
+"""Process-wide registry of open RocksDB handles"""
+
+import atexit
+import os
+import threading
+import typing as tp
+
+from rocksdict import Options, Rdict
+
+# Handles stay open for the life of the process, so callers sync the WAL after
+# every write: `./data` is a gcsfuse mount that only uploads a file on fsync or
+# close. Other processes never see these writes through their own open handles,
+# so the service must run as a single instance.
+DATABASES: dict[str, Rdict] = {}
+# RocksDB refuses a second handle to a directory, and sync routes open from the
+# threadpool, so opening must be atomic
+DATABASES_LOCK = threading.Lock()
+
+
+def open_db(path: str, options: tp.Optional[tp.Callable[[], Options]] = None) -> Rdict:
+    """Return the open handle for `path`, opening it on first use."""
+    with DATABASES_LOCK:
+        if path not in DATABASES:
+            os.makedirs(path, exist_ok=True)
+            DATABASES[path] = Rdict(path, options()) if options else Rdict(path)
+        return DATABASES[path]
+
+
+@atexit.register
+def close_databases() -> None:
+    """Flush and release every RocksDB handle opened by this process."""
+    with DATABASES_LOCK:
+        for db in DATABASES.values():
+            db.close()
+        DATABASES.clear()
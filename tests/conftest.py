@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from quipubase import create_app
+
+
+INTEGRATION = Path(__file__).resolve().parent / "integration"
+
+
+def pytest_ignore_collect(collection_path: Path, config: pytest.Config):
+    """Keep live integration tests out of the default run unless targeted explicitly"""
+    if not collection_path.resolve().is_relative_to(INTEGRATION):
+        return None
+    root = config.invocation_params.dir
+    for arg in config.args:
+        if (root / arg.split("::")[0]).resolve().is_relative_to(INTEGRATION):
+            return None
+    return True
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the app, shared across the session"""
+    with TestClient(create_app()) as client:
+        yield client
+
+
+@pytest.fixture
+def cleanup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Store test collections under a per-test temporary directory"""
+    monkeypatch.setenv("COLLECTIONS_DIR", str(tmp_path))
+    yield
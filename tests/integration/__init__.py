@@ -0,0 +1 @@
+"""Integration tests against a live deployment, run with `make test-integration`"""
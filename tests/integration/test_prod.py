@@ -1,11 +1,17 @@
+import pytest
 from openai import OpenAI
 
-ai = OpenAI(
-    base_url="https://quipubase-1004773754699.southamerica-west1.run.app/v1", api_key=""
-)
 
+@pytest.fixture(scope="session")
+def ai():
+    with OpenAI(
+        base_url="https://quipubase-1004773754699.southamerica-west1.run.app/v1",
+        api_key="",
+    ) as client:
+        yield client
 
-def test_chat_completion():
+
+def test_chat_completion(ai: OpenAI):
     response = ai.chat.completions.create(
         model="gpt-4",
         messages=[
@@ -19,7 +25,7 @@ def test_chat_completion():
     assert len(content) > 0
 
 
-def test_embedding():
+def test_embedding(ai: OpenAI):
     response = ai.embeddings.create(
         model="poly-sage", input=["Hello world", "This is a test"]
     )
@@ -0,0 +1,188 @@
+"""Tests for the collection objects router"""
+
+import asyncio
+import json
+import typing as tp
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from quipubase.api.collections import service as collection_service
+from quipubase.api.collections.objects import router as objects_router
+from quipubase.api.collections.objects.service import PubSub
+from quipubase.api.collections.service import CollectionManager
+from quipubase.api.collections.typedefs import Collection, JsonSchemaModel
+
+SCHEMA = {
+    "title": "Task",
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "done": {"type": "boolean"},
+    },
+    "required": ["title", "done"],
+}
+COLLECTION_ID = "tasks"
+
+
+@pytest.fixture
+def klass(cleanup: None) -> type[Collection]:
+    """Build the test collection class without storing its schema"""
+    return JsonSchemaModel(**SCHEMA).create_class()
+
+
+@pytest.fixture
+def client(
+    klass: type[Collection], monkeypatch: pytest.MonkeyPatch
+) -> tp.Iterator[TestClient]:
+    """Serve the objects router alone, resolving every collection id to `klass`"""
+
+    class Collections:
+        async def retrieve_collection(self, collection_id: str) -> type[Collection]:
+            return klass
+
+    monkeypatch.setattr(objects_router, "CollectionManager", Collections)
+    app = FastAPI()
+    app.include_router(objects_router.route(), prefix="/v1")
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def published(monkeypatch: pytest.MonkeyPatch) -> list[tp.Any]:
+    """Record published events instead of sending them to Redis"""
+    events: list[tp.Any] = []
+
+    async def pub(self: PubSub[tp.Any], channel: str, event: tp.Any) -> None:
+        events.append(event)
+
+    async def pub_many(self: PubSub[tp.Any], channel: str, batch: list[tp.Any]) -> None:
+        events.extend(batch)
+
+    monkeypatch.setattr(PubSub, "pub", pub)
+    monkeypatch.setattr(PubSub, "pub_many", pub_many)
+    return events
+
+
+def test_batch_applies_actions_in_order(
+    client: TestClient, published: list[tp.Any]
+):
+    response = client.post(
+        f"/v1/collections/objects/{COLLECTION_ID}/batch",
+        json=[
+            {"event": "create", "data": {"id": "a", "title": "A", "done": False}},
+            {"event": "update", "id": "a", "data": {"done": True}},
+            {"event": "read", "id": "a"},
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["event"] for r in data] == ["create", "update", "read"]
+    assert data[2]["data"]["done"] is True
+    assert len(published) == 3
+
+
+def test_batch_rejects_missing_target_before_writing(
+    client: TestClient, published: list[tp.Any]
+):
+    response = client.post(
+        f"/v1/collections/objects/{COLLECTION_ID}/batch",
+        json=[
+            {"event": "create", "data": {"id": "b", "title": "B", "done": False}},
+            {"event": "read", "id": "missing"},
+        ],
+    )
+    assert response.status_code == 404
+    assert "Action 1 (read)" in response.json()["detail"]
+    assert published == []
+
+    query = client.post(
+        f"/v1/collections/objects/{COLLECTION_ID}",
+        json={"event": "query", "data": {"id": "b"}},
+    )
+    assert query.status_code == 200
+    assert query.json()["data"] == []
+
+
+def test_batch_rejects_invalid_update_before_writing(
+    client: TestClient, klass: type[Collection], published: list[tp.Any]
+):
+    response = client.post(
+        f"/v1/collections/objects/{COLLECTION_ID}/batch",
+        json=[
+            {"event": "create", "data": {"id": "e", "title": "E", "done": False}},
+            {"event": "update", "id": "e", "data": {"done": [1, 2]}},
+        ],
+    )
+    assert response.status_code == 422
+    assert "Action 1 (update)" in response.json()["detail"]
+    assert published == []
+    assert klass.db().get("e") is None
+
+
+def test_batch_publishes_applied_actions_when_one_fails(
+    client: TestClient,
+    published: list[tp.Any],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    apply = objects_router._apply
+
+    def flaky(klass: tp.Any, req: tp.Any):
+        if req.data and req.data.get("id") == "d":
+            raise RuntimeError("disk full")
+        return apply(klass, req)
+
+    monkeypatch.setattr(objects_router, "_apply", flaky)
+    response = client.post(
+        f"/v1/collections/objects/{COLLECTION_ID}/batch",
+        json=[
+            {"event": "create", "data": {"id": "c", "title": "C", "done": False}},
+            {"event": "create", "data": {"id": "d", "title": "D", "done": False}},
+        ],
+    )
+    assert response.status_code == 500
+    assert "Action 1 (create)" in response.json()["detail"]
+    assert [event.data.id for event in published] == ["c"]
+
+
+class Row(SimpleNamespace):
+    def model_dump_json(self) -> str:
+        return json.dumps(vars(self), default=str)
+
+
+class Rows:
+    """In-memory stand-in for the collection schema table"""
+
+    def __init__(self):
+        self.rows: list[Row] = []
+
+    async def find_unique(self, where: dict[str, str]) -> tp.Optional[Row]:
+        ((key, value),) = where.items()
+        return next((r for r in self.rows if getattr(r, key) == value), None)
+
+    async def create(self, data: dict[str, tp.Any]) -> Row:
+        self.rows.append(Row(**data))
+        return self.rows[-1]
+
+
+def test_recreating_a_collection_keeps_its_records(
+    cleanup: None, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(collection_service, "collection", SimpleNamespace(prisma=Rows))
+    monkeypatch.setattr(collection_service, "Json", lambda data: data)
+    manager = CollectionManager.__wrapped__()  # type: ignore
+
+    async def run():
+        created = await manager.create_collection(data=JsonSchemaModel(**SCHEMA))
+        klass = await manager.retrieve_collection(created["id"])
+        klass.model_validate({"id": "r1", "title": "R1", "done": False}).create()
+
+        again = await manager.create_collection(data=JsonSchemaModel(**SCHEMA))
+        assert again["id"] == created["id"]
+        retrieved = await manager.retrieve_collection(created["id"])
+        assert retrieved.col_path() == klass.col_path()
+        assert [r.id for r in retrieved.find()] == ["r1"]
+
+    asyncio.run(run())
@@ -0,0 +1,82 @@
+"""Tests for the per-namespace vector index"""
+
+import numpy as np
+
+from quipubase.api.vector.services import index as vector_index
+from quipubase.api.vector.services.index import VectorIndex
+from quipubase.api.vector.typedefs import Embedding
+
+
+def make_embeddings(n: int, *, seed: int = 0, prefix: str = "t") -> list[Embedding]:
+    rng = np.random.default_rng(seed)
+    return [
+        Embedding(
+            content=f"{prefix}{i}",
+            embedding=rng.standard_normal(16).astype(np.float32),
+        )
+        for i in range(n)
+    ]
+
+
+def brute_force(corpus: list[Embedding], query: np.ndarray, top_k: int) -> list[str]:
+    vectors = np.stack([e.embedding / np.linalg.norm(e.embedding) for e in corpus])
+    scores = vectors @ (query / np.linalg.norm(query))
+    return [corpus[i].id for i in np.argsort(-scores)[:top_k]]
+
+
+def search(index: VectorIndex, query: np.ndarray, top_k: int) -> list[str]:
+    # A candidate list as large as the graph makes HNSW exact for the comparison
+    return [m.id for m in index.search(query, top_k, ef_search=256)]
+
+
+def test_pending_tail_merges_with_graph():
+    graph, tail = make_embeddings(100), make_embeddings(30, seed=1, prefix="p")
+    index = VectorIndex.build(graph).append(tail)
+    for query in make_embeddings(5, seed=2, prefix="q"):
+        for top_k in (1, 5, 20):
+            assert search(index, query.embedding, top_k) == brute_force(
+                graph + tail, query.embedding, top_k
+            )
+
+
+def test_append_to_empty_index():
+    tail = make_embeddings(10)
+    index = VectorIndex.build([]).append(tail)
+    query = tail[3].embedding
+    assert search(index, query, 3) == brute_force(tail, query, 3)
+
+
+def test_tombstones_are_skipped():
+    graph, tail = make_embeddings(100), make_embeddings(30, seed=1, prefix="p")
+    deleted = graph[:10] + tail[:5]
+    index = VectorIndex.build(graph).append(tail).remove([e.id for e in deleted])
+    live = graph[10:] + tail[5:]
+    # Querying with deleted vectors puts tombstoned rows at the top of each scan
+    for query in deleted:
+        assert search(index, query.embedding, 5) == brute_force(
+            live, query.embedding, 5
+        )
+
+
+def test_reupsert_clears_tombstone():
+    graph = make_embeddings(50)
+    index = VectorIndex.build(graph).remove([graph[0].id])
+    assert graph[0].id not in search(index, graph[0].embedding, 3)
+    index = index.append([graph[0]])
+    assert not index.deleted
+    results = search(index, graph[0].embedding, 3)
+    assert results == brute_force(graph, graph[0].embedding, 3)
+    assert results.count(graph[0].id) == 1
+
+
+def test_stale(monkeypatch):
+    monkeypatch.setattr(vector_index, "PENDING_LIMIT", 4)
+    graph = make_embeddings(20)
+    index = VectorIndex.build(graph)
+    assert not index.stale
+    index = index.append(make_embeddings(4, seed=1, prefix="p"))
+    assert not index.stale
+    assert index.append(make_embeddings(1, seed=2, prefix="x")).stale
+    # 24 indexed rows, so more than 6 tombstones triggers a rebuild
+    assert not index.remove([e.id for e in graph[:6]]).stale
+    assert index.remove([e.id for e in graph[:7]]).stale